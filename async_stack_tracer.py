@@ -1,28 +1,36 @@
 #!/usr/bin/env python3
 """async-stack-tracer: stealthy terminal Tetris disguised as a debugger tool.
 
-Uses only standard libraries: curses, time, random, sys.
+Uses only standard libraries: curses, time, random, os, sys. Setting
+ASYNC_STACK_TRACER_NUMBA=1 JIT-compiles the collision check with numba (and
+numpy) when installed; it is off by default because per-call dispatch costs
+more than the handful of row ANDs it replaces in interactive play.
 
 Provides `main()` for console_scripts entry points.
 """
-try:
-    import curses
-except Exception:
-    curses = None
 import time
 import random
+import os
 import sys
 
 try:
     import curses
-except ModuleNotFoundError:
+except ImportError:
     if sys.platform == 'win32':
         print("[ERROR] Missing native C-bindings for asynchronous terminal rendering.")
         print("Run the following command to patch your environment:")
         print("    pip install windows-curses")
         sys.exit(1)
-    else:
-        raise
+    raise
+
+HAVE_NUMBA = False
+if os.environ.get('ASYNC_STACK_TRACER_NUMBA') == '1':
+    try:
+        import numpy as np
+        from numba import njit
+        HAVE_NUMBA = True
+    except ImportError:
+        pass
 
 class StealthManager:
     """Manage stealth (blend-in) and boss-key (panic) behaviors.
@@ -35,16 +43,27 @@ class StealthManager:
     - A rapid double-Enter triggers a fake install sequence then exits.
     """
 
-    DOUBLE_WINDOW = 0.4
+    DOUBLE_WINDOW_NS = 400_000_000
 
     def __init__(self, stdscr):
         self.stdscr = stdscr
         self.hidden = False
         self.awaiting_double = False
-        self._last_enter_time = 0.0
+        self._last_enter_time = 0
+        # The fake debugger log never changes, so paint it off-screen once
+        self._fake_pad = curses.newpad(*stdscr.getmaxyx())
+        try:
+            self._fake_pad.addstr(0, 0, TetrisGame.HEADER[:curses.COLS - 1], curses.color_pair(1))
+            self._fake_pad.addstr(2, 0, "[INFO] Trace stack suspended at 0x00A4. Waiting for incoming stream...")
+            self._fake_pad.addstr(4, 0, "[DEBUG] Listening on port 127.0.0.1:52312...")
+            self._fake_pad.addstr(6, 0, "[WARN] Incoming frames dropped: 0")
+            self._fake_pad.addstr(8, 0, "[INFO] Press Enter to resume.")
+        except Exception:
+            pass
 
-    def handle_enter(self):
-        now = time.time()
+    def handle_enter(self, now=None):
+        if now is None:
+            now = time.monotonic_ns()
         # If not hidden: first Enter will hide and start awaiting window
         if not self.hidden:
             if not self.awaiting_double:
@@ -60,7 +79,7 @@ class StealthManager:
 
         # If currently hidden: if within awaiting window treat as panic
         if self.hidden:
-            if self.awaiting_double and (now - self._last_enter_time) <= self.DOUBLE_WINDOW:
+            if self.awaiting_double and (now - self._last_enter_time) <= self.DOUBLE_WINDOW_NS:
                 self.awaiting_double = False
                 return 'panic'
             # Otherwise a single Enter resumes
@@ -68,12 +87,20 @@ class StealthManager:
             self.awaiting_double = False
             return 'restore'
 
-    def check_timers(self):
+    def check_timers(self, now=None):
         """Call frequently to clear awaiting_double when window expires."""
         if self.awaiting_double:
-            if time.time() - self._last_enter_time > self.DOUBLE_WINDOW:
+            if now is None:
+                now = time.monotonic_ns()
+            if now - self._last_enter_time > self.DOUBLE_WINDOW_NS:
                 self.awaiting_double = False
 
+    def draw_hidden(self):
+        """Cover the whole terminal with the pre-rendered fake log."""
+        # touch so the full pad is copied again after the board was shown
+        self._fake_pad.touchwin()
+        _present(self._fake_pad)
+
     def panic_exit(self):
         # Clean up curses and print a fake installation then exit
         try:
@@ -106,8 +133,48 @@ class StealthManager:
         sys.exit(0)
 
 
+def _present(pad):
+    """Copy an off-screen pad to the top-left of the terminal in one flush."""
+    rows, cols = pad.getmaxyx()
+    pad.noutrefresh(0, 0, 0, 0, min(rows, curses.LINES) - 1, min(cols, curses.COLS) - 1)
+    curses.doupdate()
+
+
+def _row_masks(cells):
+    """Collapse (dx, dy) cells into sorted ((dy, mask), ...) with bit dx set."""
+    rows = {}
+    for dx, dy in cells:
+        rows[dy] = rows.get(dy, 0) | (1 << dx)
+    return tuple(sorted(rows.items()))
+
+
+def _piece_entry(cells):
+    """Build one _PIECE_TABLE entry: (row masks, min_dx, max_dx, min_dy, max_dy)."""
+    xs = [dx for dx, _ in cells]
+    ys = [dy for _, dy in cells]
+    return (_row_masks(cells), min(xs), max(xs), min(ys), max(ys))
+
+
+if HAVE_NUMBA:
+    def _nb_masks(rows):
+        """Split ((dy, mask), ...) into int64 (dys, masks) arrays for _valid_nb."""
+        return (np.array([dy for dy, _ in rows], dtype=np.int64),
+                np.array([mask for _, mask in rows], dtype=np.int64))
+
+    @njit(cache=True)
+    def _valid_nb(grid, dys, masks, px, py):
+        """JIT twin of the grid test in TetrisGame._valid_position (in bounds)."""
+        for i in range(masks.shape[0]):
+            mask = masks[i]
+            shifted = mask << px if px >= 0 else mask >> -px
+            if grid[py + dys[i]] & shifted:
+                return False
+        return True
+
+
 class TetrisGame:
     HEIGHT = 15  # reduce height to make board shorter
+    SCORES = (0, 100, 300, 500, 800)  # indexed by lines cleared at once
     HEADER = "[RUNNING] async-stack-tracer v1.0.4 - memory heap visualization"
 
     SHAPES = {
@@ -148,6 +215,15 @@ class TetrisGame:
     }
 
     SHAPE_KEYS = list(SHAPES.keys())
+    # Immutable (dx, dy) offsets per kind and rotation, built once
+    _OFFSETS = {k: tuple(tuple(rot) for rot in rots) for k, rots in SHAPES.items()}
+    # Per kind and rotation: row bitmasks anchored at x=0 plus bounding box,
+    # so wall/floor hits are rejected before touching the grid
+    _PIECE_TABLE = {k: tuple(_piece_entry(rot) for rot in rots) for k, rots in _OFFSETS.items()}
+    if HAVE_NUMBA:
+        _NB_MASKS = {k: tuple(_nb_masks(entry[0]) for entry in table) for k, table in _PIECE_TABLE.items()}
+    # Widest board whose rows fit the int64 arrays used by _valid_nb
+    _NB_MAX_WIDTH = 63
 
     def __init__(self, stdscr, stealth_mgr: StealthManager):
         self.stdscr = stdscr
@@ -157,19 +233,47 @@ class TetrisGame:
         _, cols = stdscr.getmaxyx()
         game_board_chars = int(cols * 2 / 3)
         self.WIDTH = max(5, game_board_chars // 2)  # min 5 blocks wide
-        self.grid = [[0 for _ in range(self.WIDTH)] for _ in range(self.HEIGHT)]
+        self.FULL_MASK = (1 << self.WIDTH) - 1
+        self.SPAWN_PX = (self.WIDTH // 2) - 2  # x centered
+        # Frames are composed off-screen and flushed with a single doupdate()
+        self._buf = curses.newpad(self.HEIGHT + 10, max(cols, self.WIDTH * 2 + 40))
+        self._use_nb = HAVE_NUMBA and self.WIDTH <= self._NB_MAX_WIDTH
+        self._reset_board()
         self.score = 0
         self.level = 1
         self.lines = 0
         self.current = None
         self.next_piece = self._random_piece()
-        self.drop_interval = 0.7
-        self.last_drop = time.time()
-        self.lock_delay = 0.5
+        # All game timers are integer nanoseconds from time.monotonic_ns()
+        self.drop_interval = 700_000_000
+        self.last_drop = time.monotonic_ns()
+        self.lock_delay = 500_000_000
         self.soft_drop = False
+        # Gravity period actually in force; only recomputed when its inputs change
+        self.effective_interval = self.drop_interval
+        # What draw() last put on screen (board as row masks), so it only
+        # repaints changed cells
+        self._prev_rows = None
+        self._prev_stats = None
+        self._prev_next = None
+        # Set whenever visible state changes; cleared by draw()
+        self._dirty = True
         self._init_curses_colors()
         self.spawn_piece()
 
+    def _reset_board(self):
+        # Each row is an int bitmask: bit x set == cell (x, y) filled, so an
+        # empty board is one flat list of small ints, not WIDTH*HEIGHT cells
+        self.grid = [0] * self.HEIGHT
+        # Topmost filled row per column; HEIGHT means the column is empty
+        self._col_heights = [self.HEIGHT] * self.WIDTH
+        self._sync_grid_nb()
+
+    def _sync_grid_nb(self):
+        # _valid_nb reads a numpy copy of the rows; refresh it after grid edits
+        if self._use_nb:
+            self._grid_nb = np.array(self.grid, dtype=np.int64)
+
     def _init_curses_colors(self):
         try:
             curses.start_color()
@@ -180,32 +284,34 @@ class TetrisGame:
 
     def _random_piece(self):
         k = random.choice(self.SHAPE_KEYS)
-        rotations = self.SHAPES[k]
-        return {'kind': k, 'rot': 0, 'rotations': rotations}
+        rotations = self._OFFSETS[k]
+        piece = {'kind': k, 'rot': 0, 'rotations': rotations, 'table': self._PIECE_TABLE[k],
+                 'preview_cells': rotations[0]}
+        if self._use_nb:
+            piece['nb_masks'] = self._NB_MASKS[k]
+        return piece
 
     def spawn_piece(self):
         self.current = self.next_piece
         self.next_piece = self._random_piece()
         # spawn position: x centered, y at top
-        w = 4
-        self.px = (self.WIDTH // 2) - 2
+        self.px = self.SPAWN_PX
         self.py = 0
+        self._dirty = True
         if not self._valid_position(self.px, self.py, self.current['rot']):
             self.game_over()
 
-    def _shape_coords(self, piece, rot_idx=None, px=None, py=None):
-        if rot_idx is None:
-            rot_idx = piece['rot']
-        coords = []
-        for (x, y) in piece['rotations'][rot_idx % len(piece['rotations'])]:
-            coords.append((x + (px if px is not None else self.px), y + (py if py is not None else self.py)))
-        return coords
-
     def _valid_position(self, px, py, rot_idx):
-        for x, y in self._shape_coords(self.current, rot_idx, px, py):
-            if x < 0 or x >= self.WIDTH or y < 0 or y >= self.HEIGHT:
-                return False
-            if self.grid[y][x]:
+        rows, min_dx, max_dx, min_dy, max_dy = self.current['table'][rot_idx]
+        if px + min_dx < 0 or px + max_dx >= self.WIDTH or py + min_dy < 0 or py + max_dy >= self.HEIGHT:
+            return False
+        if self._use_nb:
+            dys, masks = self.current['nb_masks'][rot_idx]
+            return _valid_nb(self._grid_nb, dys, masks, px, py)
+        # In bounds, so shifting right for px < 0 only drops empty columns
+        grid = self.grid
+        for dy, mask in rows:
+            if grid[py + dy] & (mask << px if px >= 0 else mask >> -px):
                 return False
         return True
 
@@ -213,135 +319,219 @@ class TetrisGame:
         new_rot = (self.current['rot'] + 1) % len(self.current['rotations'])
         if self._valid_position(self.px, self.py, new_rot):
             self.current['rot'] = new_rot
+            self._dirty = True
 
     def move(self, dx):
         nx = self.px + dx
         if self._valid_position(nx, self.py, self.current['rot']):
             self.px = nx
+            self._dirty = True
 
-    def soft_drop_on(self):
-        self.soft_drop = True
+    def set_soft_drop(self, on):
+        # Called every frame from main(); only act when the state flips
+        if on != self.soft_drop:
+            self.soft_drop = on
+            self._update_interval()
 
-    def soft_drop_off(self):
-        self.soft_drop = False
+    def _update_interval(self):
+        self.effective_interval = self.drop_interval // 5 if self.soft_drop else self.drop_interval
 
     def hard_drop(self):
-        # Not required, but useful: drop until collision
-        while self._valid_position(self.px, self.py + 1, self.current['rot']):
-            self.py += 1
+        # Land each cell just above the top of its column
+        heights = self._col_heights
+        px = self.px
+        land = min(heights[px + dx] - dy - 1 for dx, dy in self.current['rotations'][self.current['rot']])
+        if land >= self.py:
+            self.py = land
+        else:
+            # piece is tucked under an overhang: drop until collision
+            while self._valid_position(self.px, self.py + 1, self.current['rot']):
+                self.py += 1
         self.lock_piece()
 
     def lock_piece(self):
-        for x, y in self._shape_coords(self.current):
-            if 0 <= y < self.HEIGHT and 0 <= x < self.WIDTH:
-                self.grid[y][x] = 1
+        px, py = self.px, self.py
+        for dy, mask in self.current['table'][self.current['rot']][0]:
+            y = py + dy
+            if 0 <= y < self.HEIGHT:
+                self.grid[y] |= (mask << px if px >= 0 else mask >> -px) & self.FULL_MASK
+        heights = self._col_heights
+        for dx, dy in self.current['rotations'][self.current['rot']]:
+            if py + dy < heights[px + dx]:
+                heights[px + dx] = py + dy
         cleared = self.clear_lines()
-        self.score += {0:0,1:100,2:300,3:500,4:800}.get(cleared, 0)
+        self._sync_grid_nb()
+        self.score += self.SCORES[cleared]
         self.lines += cleared
+        self._dirty = True
         self.level = 1 + (self.lines // 10)
-        self.drop_interval = max(0.12, 0.7 - (self.level - 1) * 0.05)
+        self.drop_interval = max(120_000_000, 700_000_000 - (self.level - 1) * 50_000_000)
+        self._update_interval()
         self.spawn_piece()
 
     def clear_lines(self):
-        new_grid = [row for row in self.grid if any(cell == 0 for cell in row)]
+        full = self.FULL_MASK
+        new_grid = [row for row in self.grid if row != full]
         cleared = self.HEIGHT - len(new_grid)
-        for _ in range(cleared):
-            new_grid.insert(0, [0 for _ in range(self.WIDTH)])
-        self.grid = new_grid
+        if cleared:
+            self.grid = [0] * cleared + new_grid
+            self._rescan_col_heights()
         return cleared
 
-    def step(self):
-        now = time.time()
-        interval = self.drop_interval * (0.2 if self.soft_drop else 1.0)
-        if now - self.last_drop >= interval:
+    def _rescan_col_heights(self):
+        heights = [self.HEIGHT] * self.WIDTH
+        for y in range(self.HEIGHT - 1, -1, -1):
+            row = self.grid[y]
+            x = 0
+            while row:
+                if row & 1:
+                    heights[x] = y
+                row >>= 1
+                x += 1
+        self._col_heights = heights
+
+    def step(self, now=None):
+        if now is None:
+            now = time.monotonic_ns()
+        if now - self.last_drop >= self.effective_interval:
             if self._valid_position(self.px, self.py + 1, self.current['rot']):
                 self.py += 1
+                self._dirty = True
             else:
                 self.lock_piece()
             self.last_drop = now
 
     def game_over(self):
         # simple game over behavior: reset board
-        self.grid = [[0 for _ in range(self.WIDTH)] for _ in range(self.HEIGHT)]
+        self._reset_board()
         self.score = 0
         self.lines = 0
         self.level = 1
         self.next_piece = self._random_piece()
         self.spawn_piece()
 
-    def draw(self):
-        self.stdscr.erase()
-        # Header
-        try:
-            self.stdscr.addstr(0, 0, self.HEADER[:curses.COLS - 1], curses.color_pair(1))
-        except Exception:
-            pass
+    def invalidate(self):
+        """Recopy the whole board to the terminal on the next draw().
+
+        The pad still holds the current frame, so nothing is redrawn; this
+        only matters after something else (the fake log) covered the screen.
+        """
+        self._buf.touchwin()
+        self._dirty = True
 
+    def draw(self):
         # Board top-left
         origin_y = 2
         origin_x = 2
-
-        # draw grid background as spaces and borders
-        for y in range(self.HEIGHT):
-            for x in range(self.WIDTH):
-                ch = '  ' if not self.grid[y][x] else '▓▓'
-                attr = curses.color_pair(1) if self.grid[y][x] else curses.A_NORMAL
-                try:
-                    self.stdscr.addstr(origin_y + y, origin_x + x * 2, ch, attr)
-                except Exception:
-                    pass
-
-        # draw current piece
-        for x, y in self._shape_coords(self.current):
-            if y >= 0:
-                try:
-                    self.stdscr.addstr(origin_y + y, origin_x + x * 2, '▓▓', curses.color_pair(1))
-                except Exception:
-                    pass
-
-        # right-hand stats
         stats_x = origin_x + self.WIDTH * 2 + 4
-        try:
-            self.stdscr.addstr(origin_y, stats_x, f"Score: {self.score}")
-            self.stdscr.addstr(origin_y + 1, stats_x, f"Lines: {self.lines}")
-            self.stdscr.addstr(origin_y + 2, stats_x, f"Level: {self.level}")
-            self.stdscr.addstr(origin_y + 4, stats_x, "Next:")
-        except Exception:
-            pass
+        # Hoisted out of the per-cell loops below
+        addstr = self._buf.addstr
+        cp1 = curses.color_pair(1)
+        normal = curses.A_NORMAL
+        w = self.WIDTH
+
+        # One bounds check up front instead of guarding every addstr; the pad
+        # always fits the board, so only the visible terminal can be short
+        rows, cols = self.stdscr.getmaxyx()
+        if rows < origin_y + self.HEIGHT or cols < origin_x + w * 2:
+            self._buf.erase()
+            addstr(0, 0, "Terminal too small")
+            _present(self._buf)
+            self._prev_rows = None
+            self._dirty = False
+            return
 
-        # draw next piece small
         try:
-            for x, y in self._shape_coords(self.next_piece, rot_idx=0, px=0, py=0):
-                # shift into stats area
-                nx = stats_x // 2 + x
-                ny = origin_y + 6 + y
-                self.stdscr.addstr(ny, nx * 2, '▓▓', curses.color_pair(1))
+            # This frame as row masks: locked grid plus the current piece
+            frame = list(self.grid)
+            px, py = self.px, self.py
+            for dy, mask in self.current['table'][self.current['rot']][0]:
+                if 0 <= py + dy < self.HEIGHT:
+                    frame[py + dy] |= mask << px if px >= 0 else mask >> -px
+
+            prev = self._prev_rows
+            if prev is None:
+                # Rebuild the pad by overdrawing every cell rather than
+                # erasing it: diffing against the complement flips every bit.
+                # Stats and preview lines are cleared below
+                addstr(0, 0, self.HEADER[:curses.COLS - 1], cp1)
+                full = self.FULL_MASK
+                prev = [row ^ full for row in frame]
+                self._prev_stats = None
+                self._prev_next = None
+
+            # Unchanged rows cost one compare; changed ones are bit-scanned
+            for y, row in enumerate(frame):
+                changed = row ^ prev[y]
+                while changed:
+                    low = changed & -changed
+                    x = low.bit_length() - 1
+                    if row & low:
+                        addstr(origin_y + y, origin_x + x * 2, '▓▓', cp1)
+                    else:
+                        addstr(origin_y + y, origin_x + x * 2, '  ', normal)
+                    changed ^= low
+            self._prev_rows = frame
+
+            # right-hand stats
+            stats = (self.score, self.lines, self.level)
+            if stats != self._prev_stats:
+                # numbers can shrink (game over), so clear each line's tail
+                for dy in range(5):
+                    self._buf.move(origin_y + dy, stats_x)
+                    self._buf.clrtoeol()
+                addstr(origin_y, stats_x, f"Score: {self.score}")
+                addstr(origin_y + 1, stats_x, f"Lines: {self.lines}")
+                addstr(origin_y + 2, stats_x, f"Level: {self.level}")
+                addstr(origin_y + 4, stats_x, "Next:")
+                self._prev_stats = stats
+
+            # draw next piece small, wiping the previous preview first
+            if self.next_piece is not self._prev_next:
+                if self._prev_next is not None:
+                    for x, y in self._prev_next['preview_cells']:
+                        addstr(origin_y + 6 + y, (stats_x // 2 + x) * 2, '  ')
+                else:
+                    for dy in range(4):
+                        self._buf.move(origin_y + 6 + dy, stats_x)
+                        self._buf.clrtoeol()
+                for x, y in self.next_piece['preview_cells']:
+                    # shift into stats area
+                    nx = stats_x // 2 + x
+                    ny = origin_y + 6 + y
+                    addstr(ny, nx * 2, '▓▓', cp1)
+                self._prev_next = self.next_piece
+
+            _present(self._buf)
         except Exception:
-            pass
-
-        self.stdscr.refresh()
+            # safety net (e.g. a resize mid-frame): stay dirty so the next
+            # loop iteration repaints everything
+            self._prev_rows = None
+            return
+        self._dirty = False
 
 
 def main(stdscr):
     # Setup
     curses.curs_set(0)
-    stdscr.nodelay(True)
     stdscr.keypad(True)
+    # getch() blocks for at most one frame, so it doubles as the frame limiter
+    FRAME_DELAY = 0.03
+    stdscr.timeout(int(FRAME_DELAY * 1000))
 
     stealth = StealthManager(stdscr)
     game = TetrisGame(stdscr, stealth)
 
-    last_frame = time.time()
-    FRAME_DELAY = 0.03
-
     # Main loop
     while True:
-        now = time.time()
+        log_dirty = False
         # Input
         try:
             key = stdscr.getch()
         except Exception:
             key = -1
+        # One clock read per frame, taken after getch() stops blocking
+        now = time.monotonic_ns()
 
         if key != -1:
             # Map key codes
@@ -356,19 +546,27 @@ def main(stdscr):
                     game.rotate()
             elif key in (curses.KEY_DOWN, ord('s')):
                 if not stealth.hidden:
-                    game.soft_drop_on()
+                    game.set_soft_drop(True)
             elif key in (10, 13):  # Enter
-                action = stealth.handle_enter()
+                action = stealth.handle_enter(now)
                 if action == 'hide':
-                    # render fake log immediately
-                    stdscr.erase()
-                    stdscr.addstr(0, 0, "[INFO] Trace stack suspended at 0x00A4. Waiting for incoming stream...")
-                    stdscr.refresh()
+                    # render fake log this frame
+                    log_dirty = True
                 elif action == 'panic':
                     stealth.panic_exit()
                 elif action == 'restore':
-                    # just continue; game will redraw
-                    pass
+                    # the fake log replaced the board; repaint it fully
+                    game.invalidate()
+            elif key == curses.KEY_RESIZE:
+                # the terminal dropped its contents; present the current view again.
+                # Flush the resized (blank) stdscr now so a later getch() does
+                # not refresh it over the frame drawn below
+                curses.update_lines_cols()
+                stdscr.noutrefresh()
+                if stealth.hidden:
+                    log_dirty = True
+                else:
+                    game.invalidate()
             elif key in (ord('q'), 27):
                 # q or ESC to exit politely
                 try:
@@ -379,38 +577,24 @@ def main(stdscr):
 
         # Key release handling for soft drop: check if KEY_DOWN not pressed
         # We can't detect key-up easily; so if no key or other key, turn off soft_drop
-        if key == -1 or key not in (curses.KEY_DOWN, ord('s')):
-            game.soft_drop_off()
+        if key not in (curses.KEY_DOWN, ord('s')):
+            game.set_soft_drop(False)
 
         # Timers
-        stealth.check_timers()
+        stealth.check_timers(now)
 
         if not stealth.hidden:
             # Game active: step gravity
-            game.step()
+            game.step(now)
 
-        # Draw either game or fake log
+        # Draw either game or fake log, only when something changed
         if stealth.hidden:
-            # keep a plausible debugger-like screen
-            stdscr.erase()
-            try:
-                stdscr.addstr(0, 0, TetrisGame.HEADER[:curses.COLS - 1], curses.color_pair(1))
-                stdscr.addstr(2, 0, "[INFO] Trace stack suspended at 0x00A4. Waiting for incoming stream...")
-                stdscr.addstr(4, 0, "[DEBUG] Listening on port 127.0.0.1:52312...")
-                stdscr.addstr(6, 0, "[WARN] Incoming frames dropped: 0")
-                stdscr.addstr(8, 0, "[INFO] Press Enter to resume.")
-            except Exception:
-                pass
-            stdscr.refresh()
-        else:
+            if log_dirty:
+                # keep a plausible debugger-like screen
+                stealth.draw_hidden()
+        elif game._dirty:
             game.draw()
 
-        # Frame limiter
-        elapsed = time.time() - last_frame
-        if elapsed < FRAME_DELAY:
-            time.sleep(FRAME_DELAY - elapsed)
-        last_frame = time.time()
-
 
 def run():
     curses.wrapper(main)